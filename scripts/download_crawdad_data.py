@@ -21,6 +21,13 @@ CRAWDAD_DATASETS = {
         "description": "54 capteurs sur 4 jours, donnees temperature/humidite/luminosite",
         "type": "sensor-network",
         "format": "txt.gz"
+    },
+    "intel-berkeley-connectivity": {
+        "name": "Intel Berkeley Research Lab Connectivity",
+        "url": "http://db.csail.mit.edu/labdata/connectivity.txt",
+        "description": "Probabilites de reception radio entre paires de capteurs (emetteur recepteur probabilite)",
+        "type": "sensor-network",
+        "format": "txt"
     }
 }
 
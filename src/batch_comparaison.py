@@ -0,0 +1,156 @@
+"""
+batch_comparaison.py
+Exécution groupée de plusieurs algorithmes de détection de communautés sur les mêmes snapshots.
+Les snapshots sont chargés une seule fois puis partagés entre les méthodes (exécutées l'une après l'autre, ou en parallèle avec --workers).
+Chaque méthode produit un CSV aligné (t, nb_communities, modularity, nmi, runtime) consommable par plot_comparaison_multi.
+"""
+import argparse
+import os
+import time
+import networkx as nx
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from community_dissimilarity import detect_communities_dissimilarity, compute_nmi, compute_modularity, evaluate_approximation
+
+# Nom de méthode -> nom du fichier CSV
+METHOD_FILES = {
+    "dissimilarity": "resultats_dynamiques.csv",
+    "louvain": "louvain.csv",
+    "label_propagation": "label_propagation.csv",
+    "greedy_modularity": "greedy_modularity.csv",
+}
+
+
+def detect_communities(G, method):
+    """Détecte les communautés de G avec la méthode demandée (liste d'ensembles de noeuds)"""
+    if method == "dissimilarity":
+        return detect_communities_dissimilarity(G)
+    if G.number_of_edges() == 0:
+        return [{n} for n in G.nodes()]
+    if method == "louvain":
+        return [set(c) for c in nx.algorithms.community.louvain_communities(G, seed=42)]
+    if method == "label_propagation":
+        return [set(c) for c in nx.algorithms.community.label_propagation_communities(G)]
+    if method == "greedy_modularity":
+        return [set(c) for c in nx.algorithms.community.greedy_modularity_communities(G)]
+    raise ValueError(f"Méthode inconnue: {method}")
+
+
+def run_method(method, snapshots: List[nx.Graph]):
+    """
+    Applique une méthode à tous les snapshots et retourne une ligne de métriques par snapshot.
+    runtime : temps de détection (en secondes) pour le snapshot
+    """
+    rows = []
+    prev_communities = None
+    for t, G in enumerate(snapshots):
+        start = time.perf_counter()
+        comms = detect_communities(G, method)
+        runtime = time.perf_counter() - start
+        comms = [sorted(c) for c in comms if len(c) > 0]
+        row = {"t": t, "nb_communities": len(comms), "modularity": None, "nmi": None, "runtime": runtime}
+        if comms and G.number_of_edges() > 0:
+            try:
+                row["modularity"] = compute_modularity(G, comms)
+            except Exception as e:
+                print(f"[{method}] Snapshot t={t} : modularité non calculée (erreur: {e})")
+                row["modularity"] = None
+        if prev_communities is not None and comms:
+            row["nmi"] = compute_nmi(prev_communities, comms)
+        if comms:
+            prev_communities = comms
+        rows.append(row)
+    return rows
+
+
+def run_batch(snapshots: List[nx.Graph], methods: Optional[List[str]] = None,
+              out_dir: str = "resultats/comparaison", max_workers: int = 1) -> Dict[str, str]:
+    """
+    Exécute les méthodes demandées sur les mêmes snapshots et écrit un CSV par méthode.
+    max_workers : nombre de processus. Par défaut (1) les méthodes s'exécutent l'une après l'autre,
+    chacune seule sur la machine, pour que la colonne runtime soit comparable. Avec plus d'un processus
+    les méthodes se partagent CPU et mémoire : les runtimes sont alors mesurés sous charge parallèle.
+    Retourne un dict {méthode: chemin du CSV}.
+    """
+    if methods is None:
+        methods = list(METHOD_FILES)
+    for method in methods:
+        if method not in METHOD_FILES:
+            raise ValueError(f"Méthode inconnue: {method}")
+    os.makedirs(out_dir, exist_ok=True)
+    if max_workers == 1:
+        results = {method: run_method(method, snapshots) for method in methods}
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {method: executor.submit(run_method, method, snapshots) for method in methods}
+            results = {method: future.result() for method, future in futures.items()}
+    csv_paths = {}
+    for method, rows in results.items():
+        path = os.path.join(out_dir, METHOD_FILES[method])
+        pd.DataFrame(rows, columns=["t", "nb_communities", "modularity", "nmi", "runtime"]).to_csv(path, index=False)
+        print(f"[{method}] {len(rows)} snapshots, temps total {sum(r['runtime'] for r in rows):.3f} s -> {path}")
+        csv_paths[method] = path
+    return csv_paths
+
+
+def epsilon_type(value: str) -> float:
+    """Type argparse pour la borne d'erreur du mode approché (0 < epsilon < 1)"""
+    epsilon = float(value)
+    if not 0 < epsilon < 1:
+        raise argparse.ArgumentTypeError(f"epsilon doit être dans ]0, 1[ : {value}")
+    return epsilon
+
+
+def workers_type(value: str) -> int:
+    """Type argparse pour le nombre de processus (entier >= 1)"""
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"le nombre de processus doit être >= 1 : {value}")
+    return workers
+
+
+def load_snapshots(data_path: str) -> List[nx.Graph]:
+    """Charge les snapshots selon le format du fichier (PlaceLab .csv ou Intel Berkeley .txt/.gz)"""
+    if data_path.endswith('.csv'):
+        from placelab_loader import load_placelab_snapshots
+        return load_placelab_snapshots(data_path, rssi_threshold=-90, window_size=10.0)
+    from intel_berkeley_loader import load_intel_berkeley_snapshots
+    return load_intel_berkeley_snapshots(data_path)
+
+
+if __name__ == "__main__":
+    from main import plot_comparaison_multi
+    parser = argparse.ArgumentParser(description="Comparaison multi-méthodes sur un chargement unique des snapshots")
+    parser.add_argument("data", nargs="?", default="data/traces_placelab.csv", help="Dataset (PlaceLab .csv ou Intel Berkeley .txt.gz)")
+    parser.add_argument("--methods", nargs="+", default=list(METHOD_FILES), choices=list(METHOD_FILES))
+    parser.add_argument("--out", default="resultats/comparaison", help="Dossier de sortie des CSV et figures")
+    parser.add_argument("--workers", type=workers_type, default=1,
+                        help="Nombre de processus (défaut : 1, méthodes chronométrées seules ; >1 : runtimes sous charge parallèle)")
+    parser.add_argument("--no-plot", action="store_true", help="Ne pas générer les figures de comparaison")
+    parser.add_argument("--evaluate-approx", type=epsilon_type, metavar="EPSILON", default=None,
+                        help="Évaluer le mode approché (NMI et accélération vs exact) pour cette borne d'erreur")
+    args = parser.parse_args()
+
+    snapshots = load_snapshots(args.data)
+    print(f"{len(snapshots)} snapshots extraits de {args.data}.")
+    if args.evaluate_approx is not None:
+        rows = evaluate_approximation(snapshots, epsilon=args.evaluate_approx)
+        os.makedirs(args.out, exist_ok=True)
+        path = os.path.join(args.out, "approximation_dissimilarite.csv")
+        df = pd.DataFrame(rows)
+        df.to_csv(path, index=False)
+        print(f"NMI moyen vs exact : {df['nmi_vs_exact'].mean():.4f}, "
+              f"dissimilarités exact {df['exact_dissim_runtime'].sum():.3f} s / approché {df['approx_dissim_runtime'].sum():.3f} s, "
+              f"bout en bout exact {df['exact_runtime'].sum():.3f} s / approché {df['approx_runtime'].sum():.3f} s -> {path}")
+        raise SystemExit(0)
+    csv_paths = run_batch(snapshots, methods=args.methods, out_dir=args.out, max_workers=args.workers)
+    if not args.no_plot:
+        # Figures restreintes aux CSV de cette exécution (pas de CSV obsolètes du dossier de sortie)
+        labels = ["OUR METHOD" if m == "dissimilarity" else m.upper() for m in csv_paths]
+        for col, ylabel, name in (("nmi", "NMI", "comparaison_nmi.png"),
+                                  ("modularity", "Modularity", "comparaison_modularite.png"),
+                                  ("runtime", "Runtime (s)", "comparaison_runtime.png")):
+            plot_comparaison_multi(list(csv_paths.values()), labels, col=col, ylabel=ylabel,
+                                   out_path=os.path.join(args.out, name))
@@ -64,6 +64,10 @@ community_dissimilarity.py
 Détection de communautés dynamiques par mesure de dissimilarité
 Basé sur l'article : Dissimilarity Measure for Community Discovery in Dynamic Networks
 """
+import heapq
+import math
+import random
+import time
 import networkx as nx
 import numpy as np
 from typing import List
@@ -73,13 +77,20 @@ def compute_L(G, v):
     neighbors = list(G.neighbors(v))
     return G.subgraph(neighbors).number_of_edges()
 
-def edge_dissimilarity(G, u, v, threshold):
+def edge_dissimilarity(G, u, v, threshold, L_cache=None):
     neighbors_u = set(G.neighbors(u))
     neighbors_v = set(G.neighbors(v))
     C = len(neighbors_u & neighbors_v)
     U = len(neighbors_u | neighbors_v)
-    L = compute_L(G, u) + compute_L(G, v)
+    if L_cache is not None:
+        L = L_cache[u] + L_cache[v]
+    else:
+        L = compute_L(G, u) + compute_L(G, v)
     S = len(neighbors_u) + len(neighbors_v)
+    return dissimilarity_from_counts(C, U, L, S, threshold)
+
+def dissimilarity_from_counts(C, U, L, S, threshold):
+    """Dissimilarité d'une arête à partir de C (voisins communs), U (union), L (liens entre voisins), S (somme des degrés)"""
     if C > 0:
         if U > 0 and (C / U) < threshold:
             return L / (C * S) if (C * S) > 0 else 0
@@ -88,36 +99,127 @@ def edge_dissimilarity(G, u, v, threshold):
     else:
         return L
 
-def compute_all_dissimilarities(G):
+# --- Mode approché (snapshots très denses) ---
+APPROX_MIN_DENSITY = 0.5  # en dessous, le mode approché retombe sur le calcul exact
+APPROX_MIN_PAIRS_RATIO = 10  # L n'est échantillonné que si d(d-1)/2 >= APPROX_MIN_PAIRS_RATIO * m
+
+def approx_sample_sizes(epsilon):
+    """
+    Tailles d'échantillon pour une erreur cible epsilon :
+    - k : taille des sketches bottom-k (erreur type de l'estimation de Jaccard ~ 1/sqrt(k))
+    - m : nombre de paires de voisins tirées pour L (borne de Hoeffding, erreur <= epsilon sur la fraction à 95 %)
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon doit être dans ]0, 1[ : {epsilon}")
+    k = math.ceil(1 / epsilon ** 2)
+    m = math.ceil(math.log(2 / 0.05) / (2 * epsilon ** 2))
+    return k, m
+
+def bottom_k_sketches(G, k, rng):
+    """Sketch bottom-k (MinHash) du voisinage de chaque noeud : les k plus petites valeurs de hachage des voisins"""
+    hashes = {n: rng.random() for n in G.nodes()}
+    return {v: set(heapq.nsmallest(k, (hashes[n] for n in G.neighbors(v)))) for v in G.nodes()}
+
+def estimate_L(G, v, m, rng, epsilon):
+    """
+    Estimation du nombre de liens entre voisins de v par tirage de m paires.
+    Calcul exact si d(d-1)/2 < APPROX_MIN_PAIRS_RATIO * m, ou si la fraction de paires reliées estimée
+    est inférieure à 2 * epsilon (l'erreur absolue epsilon * d(d-1)/2 dépasserait alors la moitié de L).
+    """
+    neighbors = list(G.neighbors(v))
+    d = len(neighbors)
+    pairs = d * (d - 1) // 2
+    if pairs < APPROX_MIN_PAIRS_RATIO * m:
+        return compute_L(G, v)
+    hits = 0
+    for _ in range(m):
+        a, b = rng.sample(neighbors, 2)
+        if G.has_edge(a, b):
+            hits += 1
+    if hits / m < 2 * epsilon:
+        return compute_L(G, v)
+    return round(hits / m * pairs)
+
+def approx_edge_dissimilarity(G, u, v, threshold, sketches, L_cache, k):
+    """
+    Dissimilarité approchée : C et U estimés par bottom-k, L estimé par échantillonnage (voir estimate_L).
+    C et U sont exacts lorsque les deux sketches contiennent tout le voisinage, et recalculés exactement
+    lorsque le Jaccard estimé est inférieur à 1/k (estimation trop imprécise pour décider si C > 0).
+    """
+    du, dv = G.degree(u), G.degree(v)
+    sketch_u, sketch_v = sketches[u], sketches[v]
+    if len(sketch_u) == du and len(sketch_v) == dv:
+        C = len(sketch_u & sketch_v)
+        U = len(sketch_u | sketch_v)
+    else:
+        union = heapq.nsmallest(k, sketch_u | sketch_v)
+        jaccard = sum(1 for h in union if h in sketch_u and h in sketch_v) / len(union)
+        if jaccard < 1 / k:
+            neighbors_u = set(G.neighbors(u))
+            neighbors_v = set(G.neighbors(v))
+            C = len(neighbors_u & neighbors_v)
+            U = len(neighbors_u | neighbors_v)
+        else:
+            U = round((du + dv) / (1 + jaccard))
+            C = round(jaccard * (du + dv) / (1 + jaccard))
+    L = L_cache[u] + L_cache[v]
+    return dissimilarity_from_counts(C, U, L, du + dv, threshold)
+
+def compute_all_dissimilarities(G, approximate=False, epsilon=0.1, seed=42, min_density=APPROX_MIN_DENSITY):
+    """
+    Calcule la dissimilarité de chaque arête (attribut 'dissimilarity').
+    approximate : active l'estimation par sketches bottom-k et échantillonnage de voisins (graphes très denses)
+    epsilon : borne d'erreur visée en mode approché (plus petit = plus précis et plus lent)
+    min_density : le mode approché ne s'applique qu'aux snapshots de densité >= min_density ; ailleurs, et pour
+    les noeuds dont le voisinage est petit ou peu relié (voir estimate_L), le calcul reste exact.
+    """
     density = nx.density(G)
     threshold = 0.5 if density >= 0.001 else 0.25
+    if approximate:
+        k, m = approx_sample_sizes(epsilon)
+    if not approximate or density < min_density:
+        # L ne dépend que du noeud : calculé une fois par noeud plutôt qu'à chaque arête
+        L_cache = {v: compute_L(G, v) for v in G.nodes()}
+        for u, v in G.edges():
+            G[u][v]['dissimilarity'] = edge_dissimilarity(G, u, v, threshold, L_cache)
+        return
+    rng = random.Random(seed)
+    sketches = bottom_k_sketches(G, k, rng)
+    L_cache = {v: estimate_L(G, v, m, rng, epsilon) for v in G.nodes()}
     for u, v in G.edges():
-        G[u][v]['dissimilarity'] = edge_dissimilarity(G, u, v, threshold)
+        G[u][v]['dissimilarity'] = approx_edge_dissimilarity(G, u, v, threshold, sketches, L_cache, k)
 
-def remove_edges_iteratively(G):
+def small_component(G, node, max_size):
+    """Composante connexe de node si elle compte moins de max_size noeuds, sinon None (parcours arrêté dès max_size)"""
+    seen = {node}
+    stack = [node]
+    while stack:
+        for n in G.neighbors(stack.pop()):
+            if n not in seen:
+                seen.add(n)
+                if len(seen) >= max_size:
+                    return None
+                stack.append(n)
+    return seen
+
+def remove_edges_iteratively(G, approximate=False, epsilon=0.1):
     G = G.copy()
-    compute_all_dissimilarities(G)
+    compute_all_dissimilarities(G, approximate=approximate, epsilon=epsilon)
     edges_sorted = sorted(G.edges(data=True), key=lambda x: x[2]['dissimilarity'], reverse=True)
     # Pour chaque nœud, on garde la trace de la dernière arête supprimée qui le reliait à une autre composante
     last_bridge = dict()  # clé: frozenset(sous-graphe), valeur: (u, v)
     for u, v, data in edges_sorted:
         if G.degree(u) > 1 and G.degree(v) > 1:
-            # Avant suppression, noter les composantes auxquelles appartiennent u et v
-            comp_u = None
-            comp_v = None
-            for comp in nx.connected_components(G):
-                if u in comp:
-                    comp_u = frozenset(comp)
-                if v in comp:
-                    comp_v = frozenset(comp)
             G.remove_edge(u, v)
-            # Après suppression, si u ou v devient isolé, mémoriser la dernière arête qui le reliait
-            for comp in nx.connected_components(G):
-                if len(comp) < 4:
-                    # Trouver si comp contient u ou v
-                    if u in comp or v in comp:
-                        # On note la dernière arête supprimée qui reliait ce sous-graphe
-                        last_bridge[frozenset(comp)] = (u, v)
+            # Après suppression, si u ou v se retrouve dans un petit sous-graphe (< 4 noeuds),
+            # mémoriser la dernière arête supprimée qui le reliait (seules leurs composantes peuvent changer)
+            comp_u = small_component(G, u, 4)
+            if comp_u is not None:
+                last_bridge[frozenset(comp_u)] = (u, v)
+            if comp_u is None or v not in comp_u:
+                comp_v = small_component(G, v, 4)
+                if comp_v is not None:
+                    last_bridge[frozenset(comp_v)] = (u, v)
     return G, last_bridge
 
 def merge_small_communities(G, last_bridge, min_size=4):
@@ -154,17 +256,51 @@ def merge_small_communities(G, last_bridge, min_size=4):
         merged.append({n})
     return merged
 
-def detect_communities_dissimilarity(G, min_size=4):
-    G2, last_bridge = remove_edges_iteratively(G)
+def detect_communities_dissimilarity(G, min_size=4, approximate=False, epsilon=0.1):
+    G2, last_bridge = remove_edges_iteratively(G, approximate=approximate, epsilon=epsilon)
     communities = merge_small_communities(G2, last_bridge, min_size=min_size)
     return communities
 
 def compute_modularity(G, communities):
     return nx.algorithms.community.quality.modularity(G, communities)
 
-def process_dynamic_graphs(graph_snapshots: List[nx.Graph]):
+def process_dynamic_graphs(graph_snapshots: List[nx.Graph], approximate=False, epsilon=0.1):
     results = []
     for t, G in enumerate(graph_snapshots):
-        comms = detect_communities_dissimilarity(G)
+        comms = detect_communities_dissimilarity(G, approximate=approximate, epsilon=epsilon)
         results.append({'t': t, 'communities': comms, 'graph': G})
     return results
+
+def evaluate_approximation(graph_snapshots: List[nx.Graph], epsilon=0.1):
+    """
+    Compare le mode approché au mode exact sur chaque snapshot.
+    Retourne une ligne par snapshot : densité, temps de bout en bout et de la seule étape de dissimilarité
+    (exact/approché), accélération de bout en bout et NMI entre les deux partitions.
+    """
+    approx_sample_sizes(epsilon)
+    rows = []
+    for t, G in enumerate(graph_snapshots):
+        start = time.perf_counter()
+        compute_all_dissimilarities(G.copy())
+        exact_dissim_runtime = time.perf_counter() - start
+        start = time.perf_counter()
+        compute_all_dissimilarities(G.copy(), approximate=True, epsilon=epsilon)
+        approx_dissim_runtime = time.perf_counter() - start
+        start = time.perf_counter()
+        exact = detect_communities_dissimilarity(G)
+        exact_runtime = time.perf_counter() - start
+        start = time.perf_counter()
+        approx = detect_communities_dissimilarity(G, approximate=True, epsilon=epsilon)
+        approx_runtime = time.perf_counter() - start
+        rows.append({
+            't': t,
+            'densite': nx.density(G),
+            'nb_aretes': G.number_of_edges(),
+            'exact_dissim_runtime': exact_dissim_runtime,
+            'approx_dissim_runtime': approx_dissim_runtime,
+            'exact_runtime': exact_runtime,
+            'approx_runtime': approx_runtime,
+            'speedup': exact_runtime / approx_runtime if approx_runtime > 0 else None,
+            'nmi_vs_exact': compute_nmi(exact, approx),
+        })
+    return rows
@@ -168,33 +168,6 @@ def auto_plot_comparaisons(resultats_dir="resultats"):
     plot_comparaison_multi(csv_files, labels, col="nmi", ylabel="NMI", out_path=os.path.join(resultats_dir, "comparaison_nmi.png"))
     # Modularité
     plot_comparaison_multi(csv_files, labels, col="modularity", ylabel="Modularity", out_path=os.path.join(resultats_dir, "comparaison_modularite.png"))
-    """
-    Génère une courbe de comparaison NMI (ou modularité) multi-méthodes comme dans l'article.
-    csv_files: liste de chemins CSV (un par méthode)
-    labels: noms à afficher dans la légende
-    out_path: chemin du fichier de sortie
-    """
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    import seaborn as sns
-    plt.figure(figsize=(7,5))
-    for csv, label in zip(csv_files, labels):
-        df = pd.read_csv(csv)
-        if 'nmi' in df.columns:
-            y = df['nmi'].fillna(0).values
-        elif 'NMI' in df.columns:
-            y = df['NMI'].fillna(0).values
-        else:
-            continue
-        x = range(1, len(y)+1)
-        plt.plot(x, y, marker='o', label=label)
-    plt.xlabel('TimeSteps')
-    plt.ylabel('NMI')
-    plt.title('Normalized mutual information')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.show()
 
 if __name__ == "__main__":
     import matplotlib.pyplot as plt
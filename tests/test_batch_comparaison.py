@@ -0,0 +1,46 @@
+"""
+test_batch_comparaison.py
+Tests de l'exécution groupée multi-méthodes sur quelques petits snapshots.
+"""
+import argparse
+import os
+import sys
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch_comparaison import METHOD_FILES, run_batch, workers_type
+
+
+def make_snapshots():
+    snapshots = []
+    for seed in range(3):
+        G = nx.planted_partition_graph(2, 6, 0.9, 0.1, seed=seed)
+        snapshots.append(G)
+    return snapshots
+
+
+def test_run_batch_writes_aligned_csvs(tmp_path):
+    methods = ["dissimilarity", "louvain", "label_propagation"]
+    csv_paths = run_batch(make_snapshots(), methods=methods, out_dir=str(tmp_path), max_workers=1)
+    assert list(csv_paths) == methods
+    frames = [pd.read_csv(csv_paths[m]) for m in methods]
+    for method, df in zip(methods, frames):
+        assert os.path.basename(csv_paths[method]) == METHOD_FILES[method]
+        assert list(df.columns) == ["t", "nb_communities", "modularity", "nmi", "runtime"]
+        assert list(df["t"]) == list(frames[0]["t"]) == [0, 1, 2]
+        assert (df["runtime"] >= 0).all()
+
+
+def test_run_batch_rejects_unknown_method(tmp_path):
+    with pytest.raises(ValueError):
+        run_batch(make_snapshots(), methods=["inconnue"], out_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize("value", ["0", "-2"])
+def test_workers_type_rejects_non_positive(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        workers_type(value)
@@ -0,0 +1,82 @@
+"""
+test_community_dissimilarity.py
+Tests du calcul des dissimilarités : chemin exact (L mis en cache) et mode approché.
+"""
+import os
+import sys
+
+import networkx as nx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import community_dissimilarity
+from community_dissimilarity import (approx_sample_sizes, compute_all_dissimilarities, edge_dissimilarity,
+                                     remove_edges_iteratively)
+
+
+def dissimilarities(G, **kwargs):
+    H = G.copy()
+    compute_all_dissimilarities(H, **kwargs)
+    return {(u, v): d['dissimilarity'] for u, v, d in H.edges(data=True)}
+
+
+def two_hubs():
+    """Deux étoiles (hub + anneau de 30 feuilles) reliées par l'arête a-b"""
+    G = nx.Graph()
+    for hub, offset in (('a', 0), ('b', 100)):
+        leaves = [offset + i for i in range(30)]
+        G.add_edges_from((hub, leaf) for leaf in leaves)
+        G.add_edges_from((leaves[i], leaves[(i + 1) % 30]) for i in range(30))
+    G.add_edge('a', 'b')
+    return G
+
+
+@pytest.mark.parametrize("G", [nx.gnp_random_graph(40, 0.3, seed=1), nx.planted_partition_graph(3, 10, 0.8, 0.1, seed=2)])
+def test_cached_exact_path_matches_uncached(G):
+    threshold = 0.5 if nx.density(G) >= 0.001 else 0.25
+    values = dissimilarities(G)
+    for (u, v), value in values.items():
+        assert value == edge_dissimilarity(G, u, v, threshold, L_cache=None)
+
+
+@pytest.mark.parametrize("G", [nx.gnp_random_graph(40, 0.4, seed=2), nx.gnp_random_graph(60, 0.8, seed=3)])
+def test_approximate_matches_exact_when_fully_covered(G):
+    # epsilon=0.1 : k=100 > degré max, et d(d-1)/2 sous le seuil d'échantillonnage de L
+    assert max(d for _, d in G.degree()) < approx_sample_sizes(0.1)[0]
+    assert dissimilarities(G, approximate=True, epsilon=0.1, min_density=0) == dissimilarities(G)
+
+
+def test_approximate_counts_exact_when_union_exceeds_k(monkeypatch):
+    # Degrés <= k mais |N(u) ∪ N(v)| > k : C et U doivent rester exacts (L exact pour isoler C et U)
+    monkeypatch.setattr(community_dissimilarity, "APPROX_MIN_PAIRS_RATIO", 10 ** 9)
+    G = nx.gnp_random_graph(150, 0.5, seed=2)
+    assert max(d for _, d in G.degree()) < approx_sample_sizes(0.1)[0]
+    assert dissimilarities(G, approximate=True, epsilon=0.1, min_density=0) == dissimilarities(G)
+
+
+def test_approximate_keeps_bridge_between_sparse_hubs_first():
+    G = two_hubs()
+    exact = dissimilarities(G)
+    approx = dissimilarities(G, approximate=True, epsilon=0.2, min_density=0)
+    bridge = ('a', 'b') if ('a', 'b') in exact else ('b', 'a')
+    assert approx[bridge] == exact[bridge]
+    assert max(approx, key=approx.get) == bridge
+    # Snapshot peu dense : le seuil de densité par défaut garde le calcul exact
+    assert dissimilarities(G, approximate=True, epsilon=0.2) == exact
+
+
+def test_approximate_on_dense_snapshot_runs_and_removes_edges():
+    G = nx.gnp_random_graph(120, 0.9, seed=4)
+    values = dissimilarities(G, approximate=True, epsilon=0.2)
+    assert set(values) == set(G.edges())
+    G2, _ = remove_edges_iteratively(G, approximate=True, epsilon=0.2)
+    assert G2.number_of_edges() < G.number_of_edges()
+
+
+@pytest.mark.parametrize("epsilon", [0, -0.1, 1, 1.5])
+def test_invalid_epsilon_raises(epsilon):
+    with pytest.raises(ValueError):
+        approx_sample_sizes(epsilon)
+    with pytest.raises(ValueError):
+        compute_all_dissimilarities(nx.complete_graph(5), approximate=True, epsilon=epsilon)
@@ -0,0 +1,79 @@
+"""
+test_intel_berkeley_loader.py
+Tests du chargement en flux Intel Berkeley sur un petit fichier synthétique (.gz).
+"""
+import gzip
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from intel_berkeley_loader import load_intel_berkeley_snapshots
+
+WINDOW_SIZE = 10
+NB_EPOCHS = 60
+
+
+def active_motes(window):
+    """Capteurs actifs : 1-3 dans les fenêtres paires, 1-5 dans les fenêtres impaires"""
+    return {1, 2, 3} if window % 2 == 0 else {1, 2, 3, 4, 5}
+
+
+@pytest.fixture
+def intel_files(tmp_path):
+    data_path = tmp_path / "intel-berkeley.txt.gz"
+    with gzip.open(data_path, 'wt') as f:
+        for epoch in range(NB_EPOCHS):
+            for mote in sorted(active_motes(epoch // WINDOW_SIZE)):
+                f.write(f"2004-02-28 00:59:16.02785 {epoch} {mote} 19.98 37.09 45.08 2.69\n")
+        # Lignes vides ou mal formées
+        f.write("\n")
+        f.write("2004-02-28 00:59:16\n")
+        f.write("2004-02-28 00:59:16.02785 abc 3 19.98 37.09 45.08 2.69\n")
+    connectivity_path = tmp_path / "connectivity.txt"
+    connectivity_path.write_text(
+        "1 2 0.9\n2 1 0.8\n"      # moyenne 0.85
+        "2 3 0.6\n3 2 0.2\n"      # moyenne 0.40
+        "1 3 0.9\n"               # un seul sens : moyenne 0.45
+        "3 4 1.0\n4 3 1.0\n"
+        "4 5 0.7\n5 4 0.7\n"
+        "1 1 1.0\n"               # boucle ignorée
+        "x y z\n"
+        "\n"
+    )
+    return str(data_path), str(connectivity_path)
+
+
+def test_snapshots_per_window(intel_files):
+    data_path, connectivity_path = intel_files
+    stats = {}
+    snapshots = load_intel_berkeley_snapshots(data_path, connectivity_path=connectivity_path,
+                                              window_size=WINDOW_SIZE, stats=stats)
+    assert len(snapshots) == NB_EPOCHS // WINDOW_SIZE
+    for window, G in enumerate(snapshots):
+        assert set(G.nodes()) == active_motes(window)
+    nb_rows = sum(WINDOW_SIZE * len(active_motes(w)) for w in range(NB_EPOCHS // WINDOW_SIZE))
+    assert stats['rows'] == nb_rows + 3
+    assert stats['skipped'] == 3
+
+
+def test_edges_follow_link_threshold(intel_files):
+    data_path, connectivity_path = intel_files
+    snapshots = load_intel_berkeley_snapshots(data_path, connectivity_path=connectivity_path,
+                                              link_threshold=0.5, window_size=WINDOW_SIZE)
+    edges = [{frozenset(e) for e in G.edges()} for G in snapshots]
+    assert edges[0] == {frozenset((1, 2))}
+    assert edges[1] == {frozenset((1, 2)), frozenset((3, 4)), frozenset((4, 5))}
+    assert snapshots[0][1][2]['link_quality'] == pytest.approx(0.85)
+
+    snapshots = load_intel_berkeley_snapshots(data_path, connectivity_path=connectivity_path,
+                                              link_threshold=0.4, window_size=WINDOW_SIZE)
+    assert {frozenset(e) for e in snapshots[0].edges()} == {frozenset((1, 2)), frozenset((2, 3)), frozenset((1, 3))}
+
+
+def test_connectivity_found_next_to_data(intel_files):
+    data_path, _ = intel_files
+    snapshots = load_intel_berkeley_snapshots(data_path, window_size=WINDOW_SIZE)
+    assert len(snapshots) == NB_EPOCHS // WINDOW_SIZE